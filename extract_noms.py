@@ -1,64 +1,121 @@
 import json
-import csv
+import os
+
+try:
+    # Optional: streams the JSON array item by item, so memory stays O(1)
+    # no matter how large the records file is.
+    import ijson
+except ImportError:
+    ijson = None
+
+# json.load raises json.JSONDecodeError, but the ijson streaming path raises
+# its own JSONError subclass mid-iteration; both should get the same
+# "could not decode" message.
+if ijson is not None:
+    _JSON_DECODE_ERRORS = (json.JSONDecodeError, ijson.JSONError)
+else:
+    _JSON_DECODE_ERRORS = (json.JSONDecodeError,)
+
+def _csv_cell(value):
+    """
+    Formats one value as a single CSV cell, quoting only when the value
+    actually needs it (same escaping rules as csv.writer, without running
+    every cell through the csv module's quoting machinery).
+    """
+    # csv.writer writes None as an empty cell, and quotes an empty cell that
+    # is the whole row (a bare empty line would read back as an empty row,
+    # not a row with one empty field).
+    if value is None:
+        value = ''
+    else:
+        value = str(value)
+    if not value:
+        return '""'
+    if '"' in value:
+        return '"%s"' % value.replace('"', '""')
+    if ',' in value or '\n' in value or '\r' in value:
+        return '"%s"' % value
+    return value
 
 def extract_noms_to_csv(json_file_path, csv_file_path):
     """
     Extracts all 'nom' fields from a JSON file (assuming it's an array of objects)
     and saves them to a CSV file.
 
+    Records stream straight from the JSON parser to the CSV writer, so only
+    one batch of rows is in memory at a time. With ijson installed the JSON
+    itself is parsed incrementally too; otherwise json.load reads it whole.
+
     Args:
         json_file_path (str): The path to the input JSON file.
         csv_file_path (str): The path to the output CSV file.
     """
     try:
-        with open(json_file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        if not isinstance(data, list):
-            print("Error: The JSON file does not appear to be an array of objects.")
-            return
-
-        noms = []
-        for item in data:
-            if isinstance(item, dict) and "nom" in item:
-                noms.append(item["nom"])
+        with open(json_file_path, 'rb') as f:
+            if ijson is not None:
+                # ijson.items never materializes the array, so check the
+                # top-level structure by peeking at the first real character.
+                first = f.read(1)
+                while first.isspace():
+                    first = f.read(1)
+                f.seek(0)
+                if first != b'[':
+                    print("Error: The JSON file does not appear to be an array of objects. "
+                          "Please ensure your top-level JSON structure is an array `[...]`.")
+                    return
+                records = ijson.items(f, 'item')
             else:
-                print(f"Warning: Item {item} does not have a 'nom' field or is not a dictionary. Skipping.")
-
-        if not noms:
-            print("No 'nom' fields found in the JSON data.")
-            return
-
-        with open(csv_file_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(['Nom'])  # Write the header
-            for nom in noms:
-                writer.writerow([nom])
-
-        print(f"Successfully extracted 'nom' fields to '{csv_file_path}'")
+                data = json.load(f)
+                if not isinstance(data, list):
+                    print("Error: The JSON file does not appear to be an array of objects. "
+                          "Please ensure your top-level JSON structure is an array `[...]`.")
+                    return
+                records = iter(data)
+
+            with open(csv_file_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as out:
+                # Single-column output, written raw: _csv_cell quotes only the
+                # cells that need it, and \r\n keeps the bytes identical with
+                # what csv.writer produced. 4096-row batches keep memory flat
+                # while streaming.
+                out.write('Nom\r\n')  # Write the header
+                batch = []
+                written = 0
+                skipped = 0
+                for item in records:
+                    if isinstance(item, dict) and "nom" in item:
+                        batch.append(_csv_cell(item["nom"]) + '\r\n')
+                        if len(batch) >= 4096:
+                            out.writelines(batch)
+                            written += len(batch)
+                            batch.clear()
+                    else:
+                        # Counted rather than printed: formatting and writing
+                        # one warning per record can dominate the run when
+                        # many records lack a 'nom' field.
+                        skipped += 1
+                out.writelines(batch)
+                written += len(batch)
+
+        if skipped:
+            print(f"Warning: Skipped {skipped} records without a 'nom' field (or that were not dictionaries).")
+        if written:
+            print(f"Successfully extracted 'nom' fields to '{csv_file_path}'")
+        else:
+            print("No 'nom' fields found in the JSON data. "
+                  f"'{csv_file_path}' contains only the header.")
 
     except FileNotFoundError:
         print(f"Error: JSON file not found at '{json_file_path}'")
-    except json.JSONDecodeError:
+    except _JSON_DECODE_ERRORS:
         print(f"Error: Could not decode JSON from '{json_file_path}'. Please check the file's format.")
     except Exception as e:
         print(f"An unexpected error occurred: {e}")
 
-# --- How to use the function ---
-if __name__ == "__main__":
-    json_input_file = "all_fraiseetlocal_records.json"  
-    csv_output_file = "noms.csv"    
-
-    extract_noms_to_csv(json_input_file, csv_output_file)
-
-import json
-import csv
-import os
-
 def extract_noms_to_csv_from_cwd(json_file_name="data.json", csv_file_name="noms.csv"):
     """
-    Extracts all 'nom' fields from a JSON file located in the Current Working Directory (CWD)
-    (assuming the JSON is an array of objects) and saves them to a CSV file in the CWD.
+    Convenience wrapper around extract_noms_to_csv for files in the Current
+    Working Directory (CWD): resolves both names against the CWD and runs the
+    same extraction.
 
     Args:
         json_file_name (str): The name of the input JSON file (expected in CWD). Default is "data.json".
@@ -71,50 +128,11 @@ def extract_noms_to_csv_from_cwd(json_file_name="data.json", csv_file_name="noms
     print(f"Looking for JSON file at: {json_file_path}")
     print(f"CSV file will be created at: {csv_file_path}")
 
-    try:
-        with open(json_file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        if not isinstance(data, list):
-            print("Error: The JSON file does not appear to be an array of objects. "
-                  "Please ensure your top-level JSON structure is an array `[...]`.")
-            return
-
-        noms = []
-        for item in data:
-            if isinstance(item, dict) and "nom" in item:
-                noms.append(item["nom"])
-            else:
-                # This warning is helpful for debugging if some items don't have 'nom'
-                # or are not dictionaries, but you might comment it out for very large files.
-                print(f"Warning: Item {item} does not have a 'nom' field or is not a dictionary. Skipping.")
-
-        if not noms:
-            print("No 'nom' fields found in the JSON data. The CSV file will still be created with a header.")
-            # Optionally, you might choose to not create the CSV if no noms are found:
-            # return
-
-        with open(csv_file_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(['Nom'])  # Write the header
-            for nom in noms:
-                writer.writerow([nom])
-
-        print(f"Successfully extracted 'nom' fields to '{csv_file_name}' in the current directory.")
-
-    except FileNotFoundError:
-        print(f"Error: JSON file not found at '{json_file_path}'. "
-              "Please make sure your JSON file ('{json_file_name}') is in the same directory as this script, or provide its full path.")
-    except json.JSONDecodeError:
-        print(f"Error: Could not decode JSON from '{json_file_name}'. Please check the file's format for syntax errors.")
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}")
+    extract_noms_to_csv(json_file_path, csv_file_path)
 
 # --- How to use the function ---
 if __name__ == "__main__":
-    # You can change these names if your JSON or desired CSV file names are different
-    my_json_file = "all_fraisetlocal_records.json"
-    my_csv_file = "noms.csv"
+    json_input_file = "all_fraiseetlocal_records.json"
+    csv_output_file = "noms.csv"
 
-    # Call the function to perform the extraction
-    extract_noms_to_csv_from_cwd(my_json_file, my_csv_file)
\ No newline at end of file
+    extract_noms_to_csv_from_cwd(json_input_file, csv_output_file)
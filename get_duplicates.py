@@ -1,8 +1,7 @@
-import csv
-import re
-from collections import Counter
 import os
 
+from tokenizer import count_words
+
 def get_unique_frequent_words(
     input_csv_path,
     output_csv_path,
@@ -24,29 +23,27 @@ def get_unique_frequent_words(
                                    in the output list.
         case_sensitive (bool): If True, "Word" and "word" are counted as different.
                                If False, they are counted as the same.
-        delimiter (str): The delimiter used in your input CSV file.
-        quotechar (str): The character used to quote fields in your input CSV file.
+        delimiter (str): Retained for backwards compatibility; counting no
+                         longer parses the CSV, so this has no effect (any
+                         non-word delimiter separates words either way).
+        quotechar (str): Retained for backwards compatibility; no effect,
+                         same reason as delimiter.
     """
 
-    all_words = []
+    # Make sure the output directory exists, once, up front. dirname() is ''
+    # when the output goes to the current directory, and makedirs('') raises,
+    # hence the guard.
+    output_dir = os.path.dirname(output_csv_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
 
     # --- Pass 1: Count word frequencies across the entire file ---
+    # The chunked scan in count_words does not need the CSV parsed at all
+    # (delimiter/quotechar are non-word characters, so they separate words
+    # just like the old per-field tokenization did).
     print(f"Pass 1: Counting word frequencies from '{input_csv_path}'...")
     try:
-        with open(input_csv_path, 'r', newline='', encoding='utf-8') as infile:
-            reader = csv.reader(infile, delimiter=delimiter, quotechar=quotechar)
-            for row in reader:
-                for field in row:
-                    # Clean and split words
-                    # Remove punctuation and split by whitespace
-                    processed_field = re.sub(r'[^\w\s]', '', field) # Keep only alphanumeric and whitespace
-                    words_in_field = processed_field.split()
-                    for word in words_in_field:
-                        # Normalize word to lowercase if case_sensitive is False
-                        # This is KEY for "FERME", "Ferme" to be counted as one
-                        if not case_sensitive:
-                            word = word.lower()
-                        all_words.append(word)
+        word_counts = count_words(input_csv_path, case_sensitive=case_sensitive)
 
     except FileNotFoundError:
         print(f"Error: Input CSV file not found at '{input_csv_path}'")
@@ -54,20 +51,19 @@ def get_unique_frequent_words(
     except Exception as e:
         print(f"An error occurred during Pass 1: {e}")
         return
-
-    word_counts = Counter(all_words)
     # The set 'frequent_words' naturally stores only unique words.
     # Because words were lowercased (if case_sensitive=False),
-    # "ferme" will appear only once here.
-    frequent_words = {word for word, count in word_counts.items() if count >= duplicate_threshold}
+    # "ferme" will appear only once here. A frozenset, since it is never
+    # mutated after this point and membership tests are marginally cheaper.
+    frequent_words = frozenset(
+        word for word, count in word_counts.items() if count >= duplicate_threshold)
 
     if not frequent_words:
         print(f"No words found with {duplicate_threshold} or more occurrences. "
               f"The output CSV '{output_csv_path}' will be created, but it will be empty (or header-only).")
         try:
-            with open(output_csv_path, 'w', newline='', encoding='utf-8') as outfile:
-                writer = csv.writer(outfile, delimiter=',') # Default to comma for single column output
-                writer.writerow(['Frequent Word']) # Write header for clarity
+            with open(output_csv_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as outfile:
+                outfile.write('Frequent Word\r\n') # Write header for clarity
             print(f"Empty or header-only CSV created at '{output_csv_path}'.")
         except Exception as e:
             print(f"Error creating output file when no frequent words: {e}")
@@ -78,15 +74,17 @@ def get_unique_frequent_words(
     # --- Pass 2: Write the unique frequent words to the new CSV file ---
     print(f"Pass 2: Writing unique frequent words to '{output_csv_path}'...")
     try:
-        with open(output_csv_path, 'w', newline='', encoding='utf-8') as outfile:
-            writer = csv.writer(outfile, delimiter=',') # Force comma delimiter for this output
-            writer.writerow(['Frequent Word']) # Write a header
+        with open(output_csv_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as outfile:
+            # The words are \w+ tokens, so they can never contain a comma,
+            # quote or newline — raw writes are safe and skip the csv
+            # module's per-cell quoting machinery. \r\n keeps the output
+            # byte-identical with what csv.writer produced.
+            outfile.write('Frequent Word\r\n') # Write a header
 
             # Sort the words alphabetically for a clean output (optional but recommended)
             sorted_frequent_words = sorted(list(frequent_words))
 
-            for word in sorted_frequent_words:
-                writer.writerow([word]) # Each word becomes a new row in the single column
+            outfile.writelines(word + '\r\n' for word in sorted_frequent_words)
 
         print(f"Successfully retrieved and saved {len(sorted_frequent_words)} unique frequent words to '{output_csv_path}'.")
 
@@ -60,54 +60,80 @@ async function initializeCommonNameFilters() {
 
     console.log("Initializing common name filters from provided list...");
     // These words are directly from the user-provided 'unique_frequent_words.csv' content.
-    const commonWordsList = ["03","09","1","10","100","11","12","13","15","16","18","19","2","20","3","37","4","5","6","7","8","a",
-        "abbaye","abeille","abeilles","abers","acacias","agricole","air","alpines","amap","apicole","apiculteur","apiculture","ar","arc",
-        "armement","artisanale","asinerie","asperges","assiette","association","atelier","ateliers","au","auberge","avenue","avicole","b",
-        "baie","balade","bar","baraques","bas","basque","basse","bastide","bateau","baume","beau","bec","bel","belette","belle","bien",
-        "biere","bio","bis","bisons","blanc","blanche","blanches","blancs","bleu","bleue","bleues","blé","bocage","boeuf","bois","bon",
-        "bonheur","bonne","bons","borde","borie","bosc","bosquet","bouche","boucherie","boulange","boulevard","bourg","bout","boutique",
-        "bouverie","brasserie","brebis","brie","brouette","brousse","brun","bruyère","bruyères","buis","buisson","bulles","buron","by",
-        "cabane","cabanon","cabra","cabras","cabrettes","cabri","cabriolait","cabrioles","cabris","café","cagouille","cailles","cal",
-        "camargue","camp","campagne","camping","campus","can","canard","canards","cap","caprice","caprices","carré","casse","cave","caveau",
-        "caves","caviar","cellier","centre","cerfs","cest","chalets","chambres","champ","champignons","champi","champs","chant","chante",
-        "chapelle","charcuterie","charme","charmes","chaudron","chaumes","chemin","chemins","chevrerie","chevres","chevriers","chez","chèvre",
-        "chèvrerie","chèvres","chêne","chênes","cidre","cidrerie","cie","ciel","cinq","ciron","citron","cité","clairette","clef","clos","clède",
-        "clé","cochon","cochons","cocotte","cocottes","coeur","coin","colline","collines","colombier","combe","combes","commanderie","compagnie",
-        "comptoir","confitures","conserves","coopérative","coquelicots","coquillages","cote","coteaux","coudriers","cour","cours",
-        "cressonnieres","creux","crinières","croix","croquez","cru","crus","cueillette","cultures","cèdres","côte","côteaux","côté","d",
-        "dabeilles","dame","damour","dangélique","dans","de","deau","delices","délices","direct","distillerie","dit","dom","domaine","domaines",
-        "dou","douceurs","drive","du","eaux","ecole","elevage","eleveurs","en","enclos","entre","epi","escales","escargot","escargots","espace",
-        "esplanade","essarts","est","et","ets","eurl","ex","exploitation","fage","famille","farine","ferme","fermeauberge","fermes","fermette",
-        "fermier","fermiers","fermière","fermières","figues","fil","fille","filles","fils","flaguerie","fleuri","fleurs","florale","foie",
-        "folies","font","fontaine","fontaines","forez","forges","forêt","fourche","fourchette","fournil","frais","fraise","fraiseraie",
-        "fraises","framboisier","france","fromagerie","fromages","fromagère","fruit","fruitière","fruits","fées","fêtes","gaec","garde",
-        "gare","garenne","général","gîte","gîtes","haie","halle","halles","hameau","haut","haute","hautes","hauts","helix","herbe","herbes",
-        "hirondelles","hop","horticole","horticulteur","horticulture","hotel","houlette","huile","huilerie","huiles","huîtres","ibis","ignames",
-        "ile","impasse","j","jardin","jardins","jas","la","labbaye","labeille","laborie","lac","lacs","lagneau","laire","lairial","lait","laiterie","lambroisie",
-        "lan","lande","landes","lapin","larbre","las","lassiette","latelier","lauberge","lavandes","lavandin","lavoir","lay","le","leau","lechelle",
-        "lecole","leglise","lenclos","les","lescargot","lescargotière","lespérance","lessenciel","lessentiel","lherbier","lherm","lhermitage",
-        "liberté","libres","lieu","lilas","lile","lill","lilot","limousin","limousine","liouner","livraison","lo","local","locavor","loges",
-        "logis","loire","loiseau","lomignon","long","lor","loriot","lorme","lorrain","lorraine","lorée","loup","lours","luberon","lycée","légumes",
-        "létable","m","ma","madame","magasin","mail","maine","mairie","maison","maisons","manade","manoir","mané","maraicher","maraichère","marais",
-        "maraîchage","maraîcher","maraîchère","marche","marché","mare","marguerite","marronniers","mas","meinau","mer","merle","meslay","mesnil","meuhg",
-        "meules","miel","miellerie","miels","mignon","mille","millet","mimosas","minervois","mirabelle","mohair","moi","mon","monde","mont","montagne",
-        "montagnes","monts","motte","moulin","moulins","moun","mouton","moutons","moutte","musée","myrtille","métairie","nature","naturellement","neuf","neuve",
-        "noir","noire","noisette","noix","nord","normand","normande","normandes","normandie","nos","nouvelle","o","oeufs","oies","oliveraie","oliviers","oléicole",
-        "orchidées","ouest","ours","pages","paille","pain","pains","palais","panier","paniers","papilles","paradis","parc","paris","parking","parvis","pas","passion",
-        "pastorale","pays","paysan","paysanne","paysannes","paysans","pe","pech","pepiniere","pepinieres","perrière","petit","petite","petites","petits","pic","pieds",
-        "pigeonneaux","pigeonnier","pigeons","pin","pis","pisciculture","place","plaine","plaisance","plaisirs","plan","plantes","plassons","plateau","plein","plessis",
-        "plume","plumes","point","poirier","pom","pommeraie","pommes","pommier","pont","porc","porcs","port","portail","porte","portes","possibles","potager","potagers",
-        "potaverger","poulailler","poule","poules","poulet","poulettes","prade","prairie","prairies","pre","pres","presbytère","presquîle","pressoir","prieuré","prim",
-        "producteur","producteurs","produits","provence","pruneau","pré","prés","ptit","ptite","ptites","ptits","puech","puy","pyrénées","pâtes","pédagogique","pépinières",
-        "périgord","pêche","pêcheurs","quatre","querelle","qui","racines","ranch","reines","relais","renard","restaurant","retrait","rhuys","rive","rivière","rivières","roc",
-        "roche","rocher","roches","roi","rose","roses","rosier","rossignol","rouge","rouges","route","ruche","rucher","ruchers","rue","république","sa","sables","sablons",
-        "sabots","safran","saison","saisons","salers","salle","salles","sauvage","sauvages","sauveur","saveur","saveurs","savoie","savonnerie","scea","scev","sel","selle",
-        "semporte","sens","serre","serres","si","simples","snc","sncf","social","soldanelles","soleil","sologne","sonnailles","sorbets","source","sources","sous","spiruline",
-        "st","stade","stand","sud","sur","suscinio","table","tapiau","temporaire","temps","terferme","terra","terre","terrefort","terres","terroir","terroirs","tilleuls",
-        "tisanes","tome","top","tour","touraine","tours","tout","tradition","treille","trois","truffe","truite","truites","trénube","tuilerie","tuileries","ty","tête","u","un",
-        "une","urbain","urbaine","vache","vaches","val","vallon","vallons","vallée","vallées","vanille","vente","vents","verger","vergers","vert","verte","vertes","verts","viande",
-        "viandes","vie","vieille","vieux","vigne","vigneron","vignerons","vignes","vignoble","vignobles","villa","village","ville","vin","vinicole","vins","vire","vivier","viviers",
-        "voie","volaille","volailles","volcans","vosges","yves","z","à","écoles","ô"
+    const commonWordsList = ["03","09","1","10","100","11","12","13","15","16","18","19","2","20","3","37","4","5","6","7","8","a","abbaye","abeille","abeilles","abers","acacias",
+        "adam","agneau","agneaux","agricole","agriculture","ailes","aille","air","aire","airial","alain","alban","albert","alex","alexandre","alice","alix","allain","allée",
+        "alpes","alphonse","alpines","alsace","amap","amblard","ambroisie","amiens","amiral","amour","ancienne","andre","andré","ane","anes","ange","anges","angoulême","angus",
+        "angélique","anjou","anne","annie","anserville","antan","anthony","antoine","antonin","api","apicole","apiculteur","apiculture","apt","aquitaine","ar","aragnon",
+        "arbogast","arbre","arc","argonne","armement","armes","arnaud","art","artisanale","asinerie","asperges","assiette","association","astier","atelier","ateliers","au",
+        "auberge","aubin","aubrac","aubry","auguste","augustin","aunis","aurelien","aurore","auré","aurélie","autan","authieux","autre","autruche","autruches","auvergne","aux",
+        "avenir","avenue","avicole","azur","b","baconnes","bagnol","baguiers","baie","bains","balade","baptiste","bar","baraques","bardot","barrois","barré","bas","basler",
+        "basque","basse","bastide","bateau","baugé","baume","bayard","bayle","beau","beauce","beaulieu","beaumont","beaurains","beauregard","bec","bel","belette","belle",
+        "bellefontaine","belles","bellevue","benjamin","benoit","benoît","berger","bergerie","bergers","bernard","bernardins","bernay","berry","bert","bertin","bertrand",
+        "besançon","bien","biere","billancourt","bio","bis","bisons","blaise","blanc","blanchard","blanche","blanches","blancs","blanquefort","bleu","bleue","bleues","blé",
+        "bocage","bodeaux","boeuf","bois","bon","bonheur","bonnaud","bonne","bonnet","bons","bonvalot","borde","bordeaux","borie","bosc","bosquet","bouche","boucherie","boulange",
+        "boulanger","boulevard","boulogne","bourg","bourgogne","bourguignon","bout","boutet","boutique","bouverie","bras","brasserie","bray","brebis","breizh","breuil","brie",
+        "brigand","brionnais","brive","brossard","brosses","brouette","brousse","brun","bruno","bruyère","bruyères","buis","buisson","bulles","burgaud","buron","bussy","by",
+        "bégude","c","cabane","cabanon","cabra","cabras","cabrettes","cabri","cabrioles","cabris","caen","café","cagouille","cailles","caillet","cal","camargue","camin","camp",
+        "campagne","camping","campus","can","canard","canards","cap","caprice","caprices","carcassonne","caro","caroire","carrière","carré","casse","caussanel","cavalerie",
+        "cavaroque","cave","caveau","caves","caviar","cellier","centre","cerfs","cevennes","ch","chalets","chambon","chambord","chambres","champ","champagne","champarts",
+        "champenois","champenoise","champi","champignons","champion","champs","chandres","chant","chante","chanteloup","chapelle","charcuterie","charentaise","charles",
+        "charlotte","charme","charmes","chateau","chatenet","chaudron","chauffour","chaumes","chemin","chemins","chevalier","chevilly","chevre","chevrerie","chevres","chevriers",
+        "chez","christelle","christian","christine","christophe","chrétienne","château","châteaux","chèvre","chèvrerie","chèvres","chêne","chênes","cidre","cidrerie","cie","ciel",
+        "cinq","ciron","citron","cité","claire","clairette","claude","clef","clos","clède","clé","clément","coat","coccinelle","cochon","cochons","cocotte","cocottes","coeur",
+        "cognac","coiffy","coin","colline","collines","colombier","combe","combes","commanderie","compagnie","compans","comptoir","comte","confitures","conserves","coopérative",
+        "coquelicots","coquillages","corbie","corinne","cormeilles","cote","coteaux","coudriers","coujan","cour","courbet","cours","courtade","couëdic","cressonnieres","creux",
+        "crigne","crinières","croix","croquez","cros","crozon","cru","crus","cueillette","cultures","cuy","cèdres","cécile","cédric","céline","cévennes","côte","côteaux","côté",
+        "d","dame","damien","daniel","dans","dauphins","dauphiné","david","de","deffends","delaunay","delices","delmotte","delphine","demoiselles","denis","des","deux","devant",
+        "devoluy","diamant","didier","dijon","direct","distillerie","dit","dom","domaine","domaines","dominique","dore","dormant","dou","douceurs","drive","du","dubois","duc",
+        "ducy","dumesnil","durand","délice","délices","e","earl","eau","eaux","ecole","eddy","eden","edith","edouard","eglise","elevage","eleveurs","elise","elles","elodie",
+        "emilie","emmanuel","emporte","en","enclos","entre","envie","eole","epi","epinay","eric","escales","escargot","escargotière","escargots","esclans","espace","esplanade",
+        "esprit","espérance","essarts","essen","essentiel","est","et","etoile","etre","ets","eurl","evesque","ex","exploitation","fabien","fabienne","fage","famille","farges",
+        "farine","felix","ferme","fermes","fermette","fermier","fermiers","fermière","fermières","ferrand","ferry","fiacre","figues","fil","fille","filles","fils","flaguerie",
+        "fleuri","fleurs","fleury","flora","florale","florence","florent","florival","flos","foie","folies","font","fontaine","fontaines","fontenelles","fontenille","forez",
+        "forges","forêt","fourche","fourchette","fourmond","fourneaux","fournil","frais","fraise","fraiseraie","fraises","framboisier","france","francine","francis","franck",
+        "francois","françois","fray","fred","freres","frick","fromagerie","fromages","fromagère","fruit","fruitière","fruits","frères","frédéric","fées","fêtes","g","gaec",
+        "gaillard","galichet","gallines","gambas","garde","gare","garenne","gatinais","gaulle","gautier","gaëtan","genets","geneviève","genevroye","georges","gerard","germain",
+        "giens","gilles","girard","giraud","glace","glaces","godet","gorvello","gourmand","gourmande","gourmandes","gourmandises","gourmands","gourmet","gourmets","goût","grain",
+        "graine","graines","grains","grand","grande","grandes","grands","grandvillain","grange","granges","gras","gratien","grau","grave","graves","grenadine","grenier","grezou",
+        "groin","gros","groupement","grémi","gue","guillaume","guionie","guy","gué","gâtinais","gâtine","général","gérard","gîte","gîtes","h","haie","halle","halles","hameau",
+        "harmonie","haut","haute","hautes","hauts","helix","henri","henry","herbe","herbes","herbier","hermitage","hervé","hilaire","hirondelles","hivert","hop","horticole",
+        "horticulteur","horticulture","hotel","houlette","hoymille","hubert","huile","huilerie","huiles","huîtres","hélix","hélène","ibis","ici","idylle","ignames","ile","ill",
+        "ille","ilot","imbermais","impasse","isabelle","isidore","isle","issy","j","jacques","jacquin","james","jane","jardin","jardins","jas","jaurès","jean","jerome","joffre",
+        "joseph","josephine","jouvente","jules","julie","julien","jumenterie","jérôme","k","karcher","karine","kerbellec","kerlijouan","l","la","laborie","lac","lacassagne",
+        "lacay","laclavette","lacombe","lacontal","lacs","lait","laiterie","laluque","lan","lande","landes","lapin","laroque","larroque","las","launay","laure","laurence",
+        "laurent","lauzière","laval","lavandes","lavandin","lavergne","lavoir","lay","le","les","leu","liberté","libres","lieu","lilas","lille","limousin","limousine","lion",
+        "liouner","livraison","local","locavor","loges","logis","loire","lomme","long","loriot","lorrain","lorraine","lou","louis","loup","luberon","luc","lucie","lucien",
+        "ludovic","luguen","luneau","lycée","lyon","lès","légumes","léon","m","ma","madame","madeleine","magasin","mail","maine","mairie","maison","maisons","manade","mannei",
+        "manoir","mané","maraicher","maraichère","marais","maraîchage","maraîcher","maraîchère","marc","marcel","marche","marché","mare","mareuil","marguerite","marie","marin",
+        "marine","marion","marius","marne","marronniers","mars","marseille","martin","martine","marty","maréchal","mas","masson","mathias","mathieu","mathilde","matthieu",
+        "maubec","maur","maurice","maya","mayne","mazet","maîtres","mc","meinau","mer","mercier","merle","meslay","mesnil","metz","meuhg","meules","meurillon","meuse","meyer",
+        "michel","mickael","micro","miel","miellerie","miels","mignon","mille","millet","milon","mimosas","minervois","mirabelle","mirebeau","mireille","mohair","moi","moigny",
+        "mon","monde","mondpa","monge","mons","monsieur","mont","montagne","montagnes","montigny","montplaisir","montreuil","monts","montégut","montélimar","motte","moulin",
+        "moulins","moun","mouton","moutons","moutte","murat","muriel","musée","myrtille","méli","mélissa","métairie","nadine","nadège","nanterre","nantes","nathalie","nature",
+        "naturel","nessadiou","neubourg","neuf","neuve","neuvic","nice","nicolas","noblesse","noir","noire","noisette","noix","nord","normand","normande","normandes","normandie",
+        "nortbert","nos","notre","nouvelle","noël","nuits","o","octeville","oeuf","oeufs","oie","oies","oisans","oliveraie","olivier","oliviers","oléicole","omignon","or",
+        "orchamps","orchidées","orme","orée","othe","ott","ouche","ouen","ouest","ours","p","pages","paille","pain","pains","palais","panier","paniers","papilles","paradis",
+        "parc","paris","parking","parvis","pas","pascal","pasquier","passion","pastorale","patrick","paul","pauline","pavillon","pays","paysan","paysanne","paysannes","paysans",
+        "pe","pech","pelletier","pepiniere","pepinieres","perrière","perron","petit","petite","petites","petits","pey","peyrouse","philippe","pic","pieds","pierre","pierrevelcin",
+        "pigeonneaux","pigeonnier","pigeons","pin","pinier","pins","pis","pisciculture","place","plaine","plaisance","plaisirs","plan","plantes","plassons","plateau","plein",
+        "plessis","plume","plumes","point","poirier","poitou","pom","pommeraie","pommes","pommier","pont","porc","porcs","port","portail","porte","portes","possibles","potager",
+        "potagers","potaverger","poulailler","poule","poules","poulet","poulettes","prade","pradel","pradines","prairie","prairies","pre","pres","presbytère","presqu","pressoir",
+        "prieuré","prim","producteur","producteurs","produits","provence","pruneau","près","pré","prés","puech","puy","pyrénées","pâtes","père","pères","pédagogique","pépinières",
+        "périgord","pêche","pêcheurs","quatre","quentin","querelle","queyras","qui","r","racines","ramard","ramon","ranch","ray","reims","reine","reines","relais","renard",
+        "renaud","renault","rennes","rené","restaurant","retrait","revel","reville","rey","rhuys","richard","rie","ried","rieux","rive","rivière","rivières","robert","robichon",
+        "robin","roc","roch","roche","rochefort","rocher","roches","roi","roland","rolland","romain","rond","rondeau","roque","rose","roses","rosier","rossignol","rouge","rouges",
+        "roumanille","rouquette","rousseau","roussel","roussillon","route","roux","roy","roys","ruche","rucher","ruchers","rue","rémy","république","s","sa","sables","sablons",
+        "sabots","safran","saint","sainte","saintonge","saison","saisons","salers","sales","salle","salles","sandrine","sarah","sarl","sas","sauvage","sauvages","sauveur",
+        "saveur","saveurs","savoie","savonnerie","scamandre","scea","scev","schaeffer","schmitt","sebastien","segida","seine","sel","selle","sens","serge","sergent","sernin",
+        "serre","serres","si","simon","simples","snc","sncf","social","soldanelles","soleil","sollier","sologne","sonnailles","sophie","sorbets","source","sources","sous",
+        "spannagel","spiruline","st","stade","stand","strasbourg","stéphane","sud","sulpice","sur","suscinio","sylvain","sébastien","table","tailhac","tapiau","tardieu","tempe",
+        "templiers","temporaire","temps","terferme","terr","terre","terrefort","terres","terroir","terroirs","thierry","thomas","tilleuls","tilloy","tisanes","tit","tite","tites",
+        "tits","tome","top","torfou","toulouse","tour","touraine","tours","tout","tradition","trapolou","treille","trois","tronquoy","tropez","truffe","truite","truites",
+        "trénube","tuilerie","tuileries","ty","tête","u","ulysse","un","une","urbain","urbaine","uzes","v","vache","vacherot","vaches","val","valette","vallespir","vallon",
+        "vallons","vallée","vallées","valérie","van","vanille","var","varennes","varet","velay","vent","vente","vents","vercors","verger","vergers","vergnes","versailles","vert",
+        "verte","vertes","vertessec","verts","viala","viande","viandes","victoire","vidal","vie","vieille","vieux","vignal","vigne","vigneron","vignerons","vignes","vignoble",
+        "vignobles","villa","village","ville","villeneuve","villette","villiers","viltain","vin","vincent","vinicole","vins","vire","virginie","vivier","viviers","voie",
+        "volaille","volailles","volcans","vosges","vous","yonne","yves","z","à","école","écoles","élevage","épine","étable","île","ô"
     ];
     _genericNameWords = new Set(commonWordsList);
     console.log(`Pre-populated ${_genericNameWords.size} common name words from the provided list.`);
@@ -0,0 +1,72 @@
+import os
+import random
+import tempfile
+import unittest
+from collections import Counter
+
+from tokenizer import _count_chunk, count_words
+
+def _parallel_count(path, splits):
+    """Sums _count_chunk over the given byte offsets, like count_words does."""
+    size = os.path.getsize(path)
+    bounds = [0] + sorted(splits) + [size]
+    total = Counter()
+    for start, end in zip(bounds, bounds[1:]):
+        total.update(_count_chunk((path, start, end, False)))
+    return total
+
+class CountChunkBoundaryTest(unittest.TestCase):
+    """
+    The parallel range protocol: a range starting at p > 0 skips through the
+    first newline at-or-after p, so the previous range must always consume
+    through the first newline at-or-after its own end — including when a read
+    lands exactly on the boundary.
+    """
+
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+
+    def _write(self, text):
+        path = os.path.join(self._tmpdir.name, 'input.csv')
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+        return path
+
+    def test_line_ends_exactly_on_boundary(self):
+        # "alpha bravo\n" is 12 bytes, so a split at 12 sits exactly on the
+        # newline boundary; the line starting there must still be counted.
+        path = self._write('alpha bravo\nlostword here\ntail line\n')
+        serial = count_words(path)
+        self.assertEqual(serial['lostword'], 1)
+        self.assertEqual(_parallel_count(path, [12]), serial)
+
+    def test_split_inside_skipped_line(self):
+        # The range [6, 12) is entirely inside lines other ranges own: its
+        # initial skip lands exactly on its end, and it must then pick up the
+        # line that starts there rather than counting nothing.
+        path = self._write('alpha bravo\nlostword here\ntail line\n')
+        serial = count_words(path)
+        self.assertEqual(_parallel_count(path, [6, 12]), serial)
+
+    def test_randomized_splits_match_serial(self):
+        rng = random.Random(7)
+        words = ['ferme', 'bio', 'abeille', 'lavande', 'x']
+        for _ in range(200):
+            lines = [
+                ' '.join(rng.choices(words, k=rng.randint(0, 4)))
+                for _ in range(rng.randint(1, 12))
+            ]
+            path = self._write(''.join(line + '\n' for line in lines))
+            size = os.path.getsize(path)
+            serial = count_words(path)
+            # count_words never produces a range starting and ending at 0, so
+            # splits start at 1; a split at `size` (empty final range) is fair
+            # game, as are duplicates (empty interior ranges).
+            n_splits = rng.randint(1, 6)
+            splits = sorted(rng.randint(1, size) for _ in range(n_splits))
+            self.assertEqual(_parallel_count(path, splits), serial,
+                             f'splits={splits} size={size} lines={lines!r}')
+
+if __name__ == '__main__':
+    unittest.main()